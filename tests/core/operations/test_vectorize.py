@@ -2,17 +2,21 @@ import numpy as np
 import pytest
 from geopandas import GeoDataFrame
 from shapely import Point
+from spatialdata import SpatialData
 from spatialdata._core.operations.vectorize import to_circles
 from spatialdata.datasets import blobs
 from spatialdata.models.models import ShapesModel
 from spatialdata.testing import assert_elements_are_identical
 
+
 # each of the tests operates on different elements, hence we can initialize the data once without conflicts
-sdata = blobs()
+@pytest.fixture(scope="module")
+def sdata() -> SpatialData:
+    return blobs()
 
 
 @pytest.mark.parametrize("is_multiscale", [False, True])
-def test_labels_2d_to_circles(is_multiscale: bool) -> None:
+def test_labels_2d_to_circles(sdata: SpatialData, is_multiscale: bool) -> None:
     key = "blobs" + ("_multiscale" if is_multiscale else "") + "_labels"
     element = sdata[key]
     new_circles = to_circles(element)
@@ -30,13 +34,13 @@ def test_labels_3d_to_circles() -> None:
     pass
 
 
-def test_circles_to_circles() -> None:
+def test_circles_to_circles(sdata: SpatialData) -> None:
     element = sdata["blobs_circles"]
     new_circles = to_circles(element)
     assert_elements_are_identical(element, new_circles)
 
 
-def test_polygons_to_circles() -> None:
+def test_polygons_to_circles(sdata: SpatialData) -> None:
     element = sdata["blobs_polygons"].iloc[:2]
     new_circles = to_circles(element)
 
@@ -49,7 +53,7 @@ def test_polygons_to_circles() -> None:
     assert_elements_are_identical(new_circles, expected)
 
 
-def test_multipolygons_to_circles() -> None:
+def test_multipolygons_to_circles(sdata: SpatialData) -> None:
     element = sdata["blobs_multipolygons"]
     new_circles = to_circles(element)
 
@@ -61,7 +65,7 @@ def test_multipolygons_to_circles() -> None:
     assert_elements_are_identical(new_circles, expected)
 
 
-def test_points_images_to_circles() -> None:
+def test_points_images_to_circles(sdata: SpatialData) -> None:
     with pytest.raises(RuntimeError, match=r"Cannot apply to_circles\(\) to images."):
         to_circles(sdata["blobs_image"])
     with pytest.raises(RuntimeError, match="Unsupported type"):
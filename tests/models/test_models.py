@@ -4,7 +4,6 @@ import os
 import re
 import tempfile
 from copy import deepcopy
-from functools import partial
 from pathlib import Path
 from typing import Any, Callable
 
@@ -19,10 +18,10 @@ from dask.dataframe.core import DataFrame as DaskDataFrame
 from geopandas import GeoDataFrame
 from multiscale_spatial_image import MultiscaleSpatialImage
 from numpy.random import default_rng
-from pandas.api.types import is_categorical_dtype
+from pandas import CategoricalDtype
 from shapely.geometry import MultiPolygon, Point, Polygon
-from shapely.io import to_ragged_array
 from spatial_image import SpatialImage, to_spatial_image
+from spatialdata._core._deepcopy import deepcopy as _deepcopy
 from spatialdata._core.spatialdata import SpatialData
 from spatialdata._types import ArrayLike
 from spatialdata.models._utils import (
@@ -67,6 +66,29 @@ from tests.conftest import (
 )
 
 RNG = default_rng(seed=0)
+_RASTER_DIMS = {
+    model: np.array(model.dims.dims).tolist() for model in [Image2DModel, Labels2DModel, Labels3DModel, Image3DModel]
+}
+# converters from a numpy array to the raster types accepted by the models; the keys are used as stable test ids
+_RASTER_CONVERTERS: dict[str, Callable[[ArrayLike, list[str], RasterSchema], Any]] = {
+    "numpy": lambda image, dims, model: image,
+    "dask": lambda image, dims, model: from_array(image),
+    "DataArray": lambda image, dims, model: DataArray(image, dims=dims),
+    "SpatialImage": lambda image, dims, model: to_spatial_image(image, dims=model.dims.dims),
+}
+
+
+@pytest.fixture(scope="class")
+def raster_data() -> dict[int, ArrayLike]:
+    # the image data does not depend on the parameters of test_raster_schema, so we create it once per class; the
+    # values are not relevant for the test, so we use deterministic ones instead of random ones
+    data = {}
+    for shape in [(10, 10), (3, 10, 10), (2, 3, 10, 10)]:
+        image = np.arange(np.prod(shape), dtype=np.float64).reshape(shape)
+        # the arrays are shared across the test cases, so we make sure that they are not modified in-place
+        image.setflags(write=False)
+        data[len(shape)] = image
+    return data
 
 
 def test_validate_axis_name():
@@ -76,6 +98,38 @@ def test_validate_axis_name():
         validate_axis_name("invalid")
 
 
+@pytest.fixture(scope="session")
+def points_data() -> pd.DataFrame:
+    coords = ["A", "B", "C", "x", "y", "z"]
+    n = 10
+    data = pd.DataFrame(RNG.integers(0, 101, size=(n, 6)), columns=coords)
+    data["target"] = pd.Series(RNG.integers(0, 2, size=(n,))).astype(str)
+    data["cell_id"] = pd.Series(RNG.integers(0, 5, size=(n,))).astype(np.int_)
+    data["anno"] = pd.Series(RNG.integers(0, 1, size=(n,))).astype(np.int_)
+    # to test for non-contiguous indices
+    data.drop(index=2, inplace=True)
+    return data
+
+
+@pytest.fixture(scope="session")
+def points_ddf(points_data: pd.DataFrame) -> DaskDataFrame:
+    return dd.from_pandas(points_data, npartitions=2)
+
+
+@pytest.fixture(scope="session")
+def parsed_points() -> dict[tuple[Any, ...], DaskDataFrame]:
+    # cache of the points parsed by test_points_model, keyed by the parameters that affect the parsing
+    return {}
+
+
+@pytest.fixture(scope="session", params=[POLYGON_PATH, MULTIPOLYGON_PATH, POINT_PATH], ids=lambda path: path.name)
+def parsed_shapes(request: pytest.FixtureRequest) -> tuple[Path, GeoDataFrame]:
+    # reading and parsing the files is the expensive part, so we do it once per path
+    path = request.param
+    radius = np.abs(RNG.normal(size=(2,))) if path.name == "points.json" else None
+    return path, ShapesModel.parse(path, radius=radius)
+
+
 @pytest.mark.ci_only
 class TestModels:
     def _parse_transformation_from_multiple_places(self, model: Any, element: Any, **kwargs) -> None:
@@ -159,29 +213,24 @@ class TestModels:
             else:
                 model.validate(element_read)
 
-    @pytest.mark.parametrize("converter", [lambda _: _, from_array, DataArray, to_spatial_image])
+    @pytest.mark.parametrize("converter", list(_RASTER_CONVERTERS))
     @pytest.mark.parametrize("model", [Image2DModel, Labels2DModel, Labels3DModel, Image3DModel])
     @pytest.mark.parametrize("permute", [True, False])
     @pytest.mark.parametrize("kwargs", [None, {"name": "test"}])
     def test_raster_schema(
-        self, converter: Callable[..., Any], model: RasterSchema, permute: bool, kwargs: dict[str, str] | None
+        self,
+        raster_data: dict[int, ArrayLike],
+        converter: str,
+        model: RasterSchema,
+        permute: bool,
+        kwargs: dict[str, str] | None,
     ) -> None:
-        dims = np.array(model.dims.dims).tolist()
+        dims = _RASTER_DIMS[model].copy()
         if permute:
             RNG.shuffle(dims)
         n_dims = len(dims)
 
-        if converter is DataArray:
-            converter = partial(converter, dims=dims)
-        elif converter is to_spatial_image:
-            converter = partial(converter, dims=model.dims.dims)
-        if n_dims == 2:
-            image: ArrayLike = RNG.uniform(size=(10, 10))
-        elif n_dims == 3:
-            image: ArrayLike = RNG.uniform(size=(3, 10, 10))
-        elif n_dims == 4:
-            image: ArrayLike = RNG.uniform(size=(2, 3, 10, 10))
-        image = converter(image)
+        image: ArrayLike = _RASTER_CONVERTERS[converter](raster_data[n_dims], dims, model)
         self._parse_transformation_from_multiple_places(model, image)
         spatial_image = model.parse(image)
         if model in [Image2DModel, Image3DModel]:
@@ -205,24 +254,26 @@ class TestModels:
             with pytest.raises(ValueError):
                 model.parse(image, **kwargs)
 
-    @pytest.mark.parametrize("model", [ShapesModel])
-    @pytest.mark.parametrize("path", [POLYGON_PATH, MULTIPOLYGON_PATH, POINT_PATH])
-    def test_shapes_model(self, model: ShapesModel, path: Path) -> None:
-        radius = np.abs(RNG.normal(size=(2,))) if path.name == "points.json" else None
-        self._parse_transformation_from_multiple_places(model, path)
-        poly = model.parse(path, radius=radius)
-        self._passes_validation_after_io(model, poly, "shapes")
+    def test_shapes_model(self, parsed_shapes: tuple[Path, GeoDataFrame]) -> None:
+        from shapely.io import to_ragged_array
+
+        path, poly = parsed_shapes
+        # the parsed shapes are shared, while the test modifies them in-place
+        poly = _deepcopy(poly)
+        radius = poly[ShapesModel.RADIUS_KEY].to_numpy() if ShapesModel.RADIUS_KEY in poly.columns else None
+        self._parse_transformation_from_multiple_places(ShapesModel, path)
+        self._passes_validation_after_io(ShapesModel, poly, "shapes")
         assert ShapesModel.GEOMETRY_KEY in poly
         assert ShapesModel.TRANSFORM_KEY in poly.attrs
         geometry, data, offsets = to_ragged_array(poly.geometry.values)
-        self._parse_transformation_from_multiple_places(model, data)
-        other_poly = model.parse(data, geometry=geometry, offsets=offsets, radius=radius)
-        self._passes_validation_after_io(model, other_poly, "shapes")
+        self._parse_transformation_from_multiple_places(ShapesModel, data)
+        other_poly = ShapesModel.parse(data, geometry=geometry, offsets=offsets, radius=radius)
+        self._passes_validation_after_io(ShapesModel, other_poly, "shapes")
         assert poly.equals(other_poly)
 
-        self._parse_transformation_from_multiple_places(model, poly)
-        other_poly = model.parse(poly)
-        self._passes_validation_after_io(model, other_poly, "shapes")
+        self._parse_transformation_from_multiple_places(ShapesModel, poly)
+        other_poly = ShapesModel.parse(poly)
+        self._passes_validation_after_io(ShapesModel, other_poly, "shapes")
         assert poly.equals(other_poly)
 
         if ShapesModel.RADIUS_KEY in poly.columns:
@@ -242,6 +293,9 @@ class TestModels:
     @pytest.mark.parametrize("coordinates", [None, {"x": "A", "y": "B", "z": "C"}])
     def test_points_model(
         self,
+        points_data: pd.DataFrame,
+        points_ddf: DaskDataFrame,
+        parsed_points: dict[tuple[Any, ...], DaskDataFrame],
         model: PointsModel,
         typ: Any,
         is_3d: bool,
@@ -255,55 +309,57 @@ class TestModels:
             return
         if coordinates is not None:
             coordinates = coordinates.copy()
-        coords = ["A", "B", "C", "x", "y", "z"]
-        n = 10
-        data = pd.DataFrame(RNG.integers(0, 101, size=(n, 6)), columns=coords)
-        data["target"] = pd.Series(RNG.integers(0, 2, size=(n,))).astype(str)
-        data["cell_id"] = pd.Series(RNG.integers(0, 5, size=(n,))).astype(np.int_)
-        data["anno"] = pd.Series(RNG.integers(0, 1, size=(n,))).astype(np.int_)
-        # to test for non-contiguous indices
-        data.drop(index=2, inplace=True)
+        # the data is shared across the test cases, so it must not be modified in-place
+        data = points_data
+        dd_data = points_ddf
         if not is_3d:
             if coordinates is not None:
                 del coordinates["z"]
             else:
-                del data["z"]
-        if typ == np.ndarray:
-            axes = ["x", "y"]
-            if is_3d:
-                axes += ["z"]
-            numpy_coords = data[axes].to_numpy()
-            self._parse_transformation_from_multiple_places(model, numpy_coords)
-            points = model.parse(
-                numpy_coords,
-                annotation=data,
-                instance_key=instance_key,
-                feature_key=feature_key,
-            )
-            self._passes_validation_after_io(model, points, "points")
-        elif typ == pd.DataFrame:
-            self._parse_transformation_from_multiple_places(model, data)
-            points = model.parse(
-                data,
-                coordinates=coordinates,
-                instance_key=instance_key,
-                feature_key=feature_key,
-            )
-            self._passes_validation_after_io(model, points, "points")
-        elif typ == dd.DataFrame:
-            dd_data = dd.from_pandas(data, npartitions=2)
-            self._parse_transformation_from_multiple_places(model, dd_data, coordinates=coordinates)
-            points = model.parse(
-                dd_data,
-                coordinates=coordinates,
-                instance_key=instance_key,
-                feature_key=feature_key,
-            )
-            if coordinates is not None:
-                axes = get_axes_names(points)
-                for axis in axes:
-                    assert np.array_equal(points[axis], data[coordinates[axis]])
-            self._passes_validation_after_io(model, points, "points")
+                data = data.drop(columns="z")
+                if typ == dd.DataFrame:
+                    dd_data = dd_data.drop(columns="z")
+        # is_annotation only affects the assertions below, so the parsed points are reused across its values
+        coordinates_key = None if coordinates is None else tuple(coordinates.items())
+        key = (model, typ, is_3d, instance_key, feature_key, coordinates_key)
+        points = parsed_points.get(key)
+        if points is None:
+            if typ == np.ndarray:
+                axes = ["x", "y"]
+                if is_3d:
+                    axes += ["z"]
+                numpy_coords = data[axes].to_numpy()
+                self._parse_transformation_from_multiple_places(model, numpy_coords)
+                points = model.parse(
+                    numpy_coords,
+                    annotation=data,
+                    instance_key=instance_key,
+                    feature_key=feature_key,
+                )
+                self._passes_validation_after_io(model, points, "points")
+            elif typ == pd.DataFrame:
+                self._parse_transformation_from_multiple_places(model, data)
+                points = model.parse(
+                    data,
+                    coordinates=coordinates,
+                    instance_key=instance_key,
+                    feature_key=feature_key,
+                )
+                self._passes_validation_after_io(model, points, "points")
+            elif typ == dd.DataFrame:
+                self._parse_transformation_from_multiple_places(model, dd_data, coordinates=coordinates)
+                points = model.parse(
+                    dd_data,
+                    coordinates=coordinates,
+                    instance_key=instance_key,
+                    feature_key=feature_key,
+                )
+                if coordinates is not None:
+                    axes = get_axes_names(points)
+                    for axis in axes:
+                        assert np.array_equal(points[axis], data[coordinates[axis]])
+                self._passes_validation_after_io(model, points, "points")
+            parsed_points[key] = points
         assert np.all(points.index.compute() == data.index)
         assert "transform" in points.attrs
         if feature_key is not None and is_annotation:
@@ -336,7 +392,7 @@ class TestModels:
         adata = AnnData(RNG.normal(size=(10, 2)), obs=obs)
         table = model.parse(adata, region=region, region_key=region_key, instance_key="A")
         assert region_key in table.obs
-        assert is_categorical_dtype(table.obs[region_key])
+        assert isinstance(table.obs[region_key].dtype, CategoricalDtype)
         assert table.obs[region_key].cat.categories.tolist() == np.unique(region).tolist()
         assert table.uns[TableModel.ATTRS_KEY][TableModel.REGION_KEY_KEY] == region_key
         assert table.uns[TableModel.ATTRS_KEY][TableModel.REGION_KEY] == region